@@ -27,10 +27,12 @@ curl -X GET 'http://uk-development-quartz-api.eu-west-1.elasticbeanstalk.com/<ro
 ```
 """  # noqa: E501
 
+import asyncio
 import functools
 import importlib
 import importlib.metadata
 import logging
+import os
 import pathlib
 import sys
 from collections.abc import Generator
@@ -46,18 +48,43 @@ from fastapi.openapi.utils import get_openapi
 from grpclib.client import Channel
 from pydantic import BaseModel
 from pyhocon import ConfigFactory, ConfigTree
-from starlette.responses import FileResponse
-from starlette.staticfiles import StaticFiles
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
 
 from quartz_api.internal import models, service
 from quartz_api.internal.backends import DataPlatformClient, DummyClient, QuartzClient
-from quartz_api.internal.middleware import audit, auth, sentry, time
+from quartz_api.internal.middleware import audit, auth, time
 
 log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG, stream=sys.stdout)
+# Quieten chatty third-party loggers, which otherwise format debug records on every request
+for _name in ("httpx", "httpcore", "grpclib", "h2", "hpack", "sqlalchemy.engine"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
 static_dir = pathlib.Path(__file__).parent.parent / "static"
 
 
+# The static asset URLs aren't versioned, so only let browsers cache them for a day. After
+# that they revalidate, getting a 304 unless a release changed the file.
+_STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+class _CachedStaticFiles(StaticFiles):
+    """Static files served with caching headers."""
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Create the file response, marking it as cacheable."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = _STATIC_CACHE_CONTROL
+        return response
+
+
 class GetHealthResponse(BaseModel):
     """Model for the health endpoint response."""
 
@@ -92,6 +119,17 @@ def _custom_openapi(server: FastAPI) -> dict[str, Any]:
     return openapi_schema
 
 
+@functools.cache
+def _load_conf(path: str) -> ConfigTree:
+    """Parse the HOCON configuration file at the given path.
+
+    Parsing is memoized per path, so repeated server creation skips re-tokenizing the file.
+    Callers should treat the returned tree as read-only, layering any overrides on top of it
+    with `with_fallback`, which operates on copies.
+    """
+    return ConfigFactory.parse_file(path)
+
+
 @asynccontextmanager
 async def _lifespan(server: FastAPI, conf: ConfigTree) -> Generator[None]:
     """Configure FastAPI app instance with startup and shutdown events."""
@@ -118,8 +156,16 @@ async def _lifespan(server: FastAPI, conf: ConfigTree) -> Generator[None]:
 
     server.dependency_overrides[models.get_db_client] = lambda: db_instance
 
+    refresh_task: asyncio.Task | None = None
+    auth_instance = server.dependency_overrides.get(auth.get_auth)
+    if isinstance(auth_instance, auth.Auth0):
+        refresh_task = asyncio.create_task(auth_instance.refresh_keys_periodically())
+
     yield
 
+    if refresh_task is not None:
+        refresh_task.cancel()
+
     if grpc_channel:
         grpc_channel.close()
 
@@ -142,7 +188,11 @@ def _create_server(conf: ConfigTree) -> FastAPI:
     )
 
     # Add the default routes
-    server.mount("/static", StaticFiles(directory=static_dir.as_posix()), name="static")
+    server.mount(
+        "/static",
+        _CachedStaticFiles(directory=static_dir.as_posix()),
+        name="static",
+    )
 
     @server.get("/health", tags=["API Information"], status_code=status.HTTP_200_OK)
     def get_health_route() -> GetHealthResponse:
@@ -150,12 +200,15 @@ def _create_server(conf: ConfigTree) -> FastAPI:
         return GetHealthResponse(status=status.HTTP_200_OK)
 
     @server.get("/favicon.ico", include_in_schema=False)
-    def favicon() -> FileResponse:
+    async def favicon() -> FileResponse:
         """Serve the favicon."""
-        return FileResponse(static_dir / "favicon.ico")
+        return FileResponse(
+            static_dir / "favicon.ico",
+            headers={"Cache-Control": _STATIC_CACHE_CONTROL},
+        )
 
     @server.get("/docs", include_in_schema=False)
-    def redoc_html() -> FileResponse:
+    async def redoc_html() -> FileResponse:
         """Render ReDoc HTML."""
         return FileResponse(static_dir / "redoc.html")
 
@@ -181,31 +234,26 @@ def _create_server(conf: ConfigTree) -> FastAPI:
             raise OSError(f"No such router router '{r}'") from e
         server.openapi_tags = [
             {
-                "name": mod.__name__.split(".")[-1].capitalize(),
+                "name": r.capitalize(),
                 "description": mod.__doc__,
             },
             *server.openapi_tags,
         ]
 
     # Customize the OpenAPI schema
-    server.openapi = lambda: _custom_openapi(server)
-
-    # Store auth instance for middleware
-    auth_instance = None
+    server.openapi = functools.partial(_custom_openapi, server)
 
     # Override dependencies according to configuration
     match (conf.get_string("auth0.domain"), conf.get_string("auth0.audience")):
         case (_, "") | ("", _):
-            auth_instance = auth.DummyAuth()
-            server.dependency_overrides[auth.get_auth] = auth_instance
+            server.dependency_overrides[auth.get_auth] = auth.DummyAuth()
             log.warning("disabled authentication. NOT recommended for production")
         case (domain, audience):
-            auth_instance = auth.Auth0(
+            server.dependency_overrides[auth.get_auth] = auth.CachedAuth0(
                 domain=domain,
                 api_audience=audience,
                 algorithm="RS256",
             )
-            server.dependency_overrides[auth.get_auth] = auth_instance
         case _:
             raise ValueError("Invalid Auth0 configuration")
 
@@ -222,7 +270,6 @@ def _create_server(conf: ConfigTree) -> FastAPI:
     )
     server.add_middleware(audit.RequestLoggerMiddleware)
     server.add_middleware(time.TimerMiddleware)
-    server.add_middleware(sentry.SentryUserMiddleware, auth_instance=auth_instance)
 
     return server
 
@@ -230,10 +277,18 @@ def _create_server(conf: ConfigTree) -> FastAPI:
 def run() -> None:
     """Run the API using a uvicorn server."""
     # Get the application configuration from the environment
-    conf = ConfigFactory.parse_file((pathlib.Path(__file__).parent / "server.conf").as_posix())
+    conf = _load_conf((pathlib.Path(__file__).parent / "server.conf").as_posix())
+
+    # Match the application log level to the configured server log level
+    loglevel = conf.get_string("api.loglevel").upper()
+    if loglevel in logging.getLevelNamesMapping():
+        logging.getLogger().setLevel(loglevel)
 
     server = _create_server(conf=conf)
 
+    # Build the OpenAPI schema up front, so the first docs request doesn't pay for it
+    server.openapi()
+
     # Run the server with uvicorn
     uvicorn.run(
         server,
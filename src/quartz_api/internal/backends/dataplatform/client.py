@@ -1,11 +1,21 @@
 """A data platform implementation that conforms to the DatabaseInterface."""
 
+import asyncio
 import datetime as dt
 import logging
+import operator
 from uuid import UUID
 
+import cachetools
 from dp_sdk.ocf import dp
+from dp_sdk.ocf.dp import (
+    GetForecastAsTimeseriesRequest,
+    GetLatestForecastsRequest,
+    GetObservationsAsTimeseriesRequest,
+    TimeWindow,
+)
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from typing_extensions import override
 
 from quartz_api.internal import models
@@ -15,17 +25,69 @@ from ..utils import get_window
 
 log = logging.getLogger("dataplatform.client")
 
+_REGIONS_CACHE_TTL_SECONDS = 60
+
+# The region listing requests never vary, so build them once rather than per call
+_WIND_REGIONS_REQUEST = dp.ListLocationsRequest(
+    energy_source_filter=dp.EnergySource.WIND,
+    location_type_filter=dp.LocationType.STATE,
+)
+_SOLAR_REGIONS_REQUEST = dp.ListLocationsRequest(
+    energy_source_filter=dp.EnergySource.SOLAR,
+    location_type_filter=dp.LocationType.STATE,
+)
+
+
+# Validating whole timeseries in one pass is much cheaper than constructing each model in turn
+_actual_power_list = TypeAdapter(list[models.ActualPower])
+_predicted_power_list = TypeAdapter(list[models.PredictedPower])
+
+# Resolves every attribute a Site needs from a location summary in a single call
+_site_attributes = operator.attrgetter(
+    "location_uuid",
+    "location_name",
+    "effective_capacity_watts",
+    "latlng.latitude",
+    "latlng.longitude",
+    "metadata.fields",
+)
+
+
+def _location_to_site(loc: dp.ListLocationsResponseLocationSummary) -> models.Site:
+    """Convert a data platform location summary into a Site."""
+    uuid, name, capacity_watts, latitude, longitude, fields = _site_attributes(loc)
+    # Look up each metadata field once, rather than probing and then indexing the map
+    orientation = fields.get("orientation")
+    tilt = fields.get("tilt")
+    return models.Site(
+        site_uuid=uuid,
+        client_site_name=name,
+        orientation=orientation.number_value if orientation is not None else None,
+        tilt=tilt.number_value if tilt is not None else None,
+        capacity_kw=capacity_watts // 1000.0,
+        latitude=latitude,
+        longitude=longitude,
+    )
+
 
 class Client(models.DatabaseInterface):
     """Defines a data platform interface that conforms to the DatabaseInterface."""
 
     dp_client: dp.DataPlatformDataServiceStub
+    _regions_cache: cachetools.TTLCache[dp.EnergySource, list[str]]
+    _regions_locks: dict[dp.EnergySource, asyncio.Lock]
 
     @classmethod
     def from_dp(cls, dp_client: dp.DataPlatformDataServiceStub) -> "Client":
         """Class method to create a new Data Platform client."""
         instance = cls()
         instance.dp_client = dp_client
+        # Regions change on human timescales, so serve them from a short-lived cache
+        instance._regions_cache = cachetools.TTLCache(maxsize=2, ttl=_REGIONS_CACHE_TTL_SECONDS)
+        instance._regions_locks = {
+            dp.EnergySource.WIND: asyncio.Lock(),
+            dp.EnergySource.SOLAR: asyncio.Lock(),
+        }
         return instance
 
     @override
@@ -90,21 +152,11 @@ class Client(models.DatabaseInterface):
 
     @override
     async def get_wind_regions(self) -> list[str]:
-        req = dp.ListLocationsRequest(
-            energy_source_filter=dp.EnergySource.WIND,
-            location_type_filter=dp.LocationType.STATE,
-        )
-        resp = await self.dp_client.list_locations(req)
-        return [loc.location_uuid for loc in resp.locations]
+        return await self._list_regions(_WIND_REGIONS_REQUEST)
 
     @override
     async def get_solar_regions(self) -> list[str]:
-        req = dp.ListLocationsRequest(
-            energy_source_filter=dp.EnergySource.SOLAR,
-            location_type_filter=dp.LocationType.STATE,
-        )
-        resp = await self.dp_client.list_locations(req)
-        return [loc.location_uuid for loc in resp.locations]
+        return await self._list_regions(_SOLAR_REGIONS_REQUEST)
 
     @override
     async def get_sites(self, authdata: dict[str, str]) -> list[models.Site]:
@@ -114,22 +166,7 @@ class Client(models.DatabaseInterface):
             user_oauth_id_filter=authdata["sub"],
         )
         resp = await self.dp_client.list_locations(req)
-        return [
-            models.Site(
-                site_uuid=loc.location_uuid,
-                client_site_name=loc.location_name,
-                orientation=loc.metadata.fields["orientation"].number_value
-                if "orientation" in loc.metadata.fields
-                else None,
-                tilt=loc.metadata.fields["tilt"].number_value
-                if "tilt" in loc.metadata.fields
-                else None,
-                capacity_kw=loc.effective_capacity_watts // 1000.0,
-                latitude=loc.latlng.latitude,
-                longitude=loc.latlng.longitude,
-            )
-            for loc in resp.locations
-        ]
+        return [_location_to_site(loc) for loc in resp.locations]
 
     @override
     async def put_site(
@@ -250,8 +287,10 @@ class Client(models.DatabaseInterface):
 
         # Scale the forecast to the substation capacity
         scale_factor: float = substation.effective_capacity_watts / gsp.effective_capacity_watts
-        for value in forecast:
-            value.PowerKW = value.PowerKW * scale_factor
+        forecast = [
+            value.model_copy(update={"PowerKW": value.PowerKW * scale_factor})
+            for value in forecast
+        ]
 
         log.debug(
             "gsp=%s, substation=%s, scalefactor=%s, scaling GSP to substation",
@@ -307,23 +346,24 @@ class Client(models.DatabaseInterface):
             )
 
         start, end = get_window()
-        req = dp.GetObservationsAsTimeseriesRequest(
+        req = GetObservationsAsTimeseriesRequest(
             location_uuid=location_uuid,
             observer_name="ruvnl",
             energy_source=energy_source,
-            time_window=dp.TimeWindow(
+            time_window=TimeWindow(
                 start_timestamp_utc=start,
                 end_timestamp_utc=end,
             ),
         )
         resp = await self.dp_client.get_observations_as_timeseries(req)
-        out: list[models.ActualPower] = [
-            models.ActualPower(
-                Time=value.timestamp_utc,
-                PowerKW=int(value.effective_capacity_watts * value.value_fraction / 1000.0),
-            )
+        rows = [
+            {
+                "Time": value.timestamp_utc,
+                "PowerKW": int(value.effective_capacity_watts * value.value_fraction / 1000.0),
+            }
             for value in resp.values
         ]
+        out: list[models.ActualPower] = _actual_power_list.validate_python(rows)
 
         return out
 
@@ -337,14 +377,6 @@ class Client(models.DatabaseInterface):
         smooth_flag: bool = True,  # noqa: ARG002
     ) -> list[models.PredictedPower]:
         """Local function to retrieve predicted values regardless of energy type."""
-        if oauth_id is not None:
-            _ = await self._check_user_access(
-                location_uuid,
-                energy_source,
-                dp.LocationType.SITE,
-                oauth_id,
-            )
-
         start, end = get_window()
 
         if forecast_horizon == models.ForecastHorizon.latest or forecast_horizon_minutes is None:
@@ -358,25 +390,40 @@ class Client(models.DatabaseInterface):
         # Use the forecaster that produced the most recent forecast for the location by default,
         # taking into account the desired horizon.
         # * At some point, we may want to allow the user to specify a particular forecaster.
-        req = dp.GetLatestForecastsRequest(
+        req = GetLatestForecastsRequest(
             location_uuid=location_uuid,
             energy_source=energy_source,
             pivot_timestamp_utc=start - dt.timedelta(minutes=forecast_horizon_minutes),
         )
-        resp = await self.dp_client.get_latest_forecasts(req)
+        if oauth_id is not None:
+            # The access check doesn't depend on the forecasts lookup, so run them concurrently
+            forecasts = asyncio.ensure_future(self.dp_client.get_latest_forecasts(req))
+            try:
+                await self._check_user_access(
+                    location_uuid,
+                    energy_source,
+                    dp.LocationType.SITE,
+                    oauth_id,
+                )
+            except BaseException:
+                # Report the failed check rather than any forecasts lookup error, and stop the
+                # lookup instead of waiting on it
+                forecasts.cancel()
+                await asyncio.gather(forecasts, return_exceptions=True)
+                raise
+            resp = await forecasts
+        else:
+            resp = await self.dp_client.get_latest_forecasts(req)
         if len(resp.forecasts) == 0:
             return []
-        resp.forecasts.sort(
-            key=lambda f: f.created_timestamp_utc,
-            reverse=True,
-        )
-        forecaster = resp.forecasts[0].forecaster
+        latest = max(resp.forecasts, key=lambda f: f.created_timestamp_utc)
+        forecaster = latest.forecaster
 
-        req = dp.GetForecastAsTimeseriesRequest(
+        req = GetForecastAsTimeseriesRequest(
             location_uuid=location_uuid,
             energy_source=energy_source,
             horizon_mins=forecast_horizon_minutes,
-            time_window=dp.TimeWindow(
+            time_window=TimeWindow(
                 start_timestamp_utc=start,
                 end_timestamp_utc=end,
             ),
@@ -384,16 +431,29 @@ class Client(models.DatabaseInterface):
         )
         resp = await self.dp_client.get_forecast_as_timeseries(req)
 
-        out: list[models.PredictedPower] = [
-            models.PredictedPower(
-                Time=value.target_timestamp_utc,
-                PowerKW=int(value.effective_capacity_watts * value.p50_value_fraction / 1000.0),
-                CreatedTime=value.created_timestamp_utc,
-            )
+        rows = [
+            {
+                "Time": value.target_timestamp_utc,
+                "PowerKW": int(value.effective_capacity_watts * value.p50_value_fraction / 1000.0),
+                "CreatedTime": value.created_timestamp_utc,
+            }
             for value in resp.values
         ]
+        out: list[models.PredictedPower] = _predicted_power_list.validate_python(rows)
         return out
 
+    async def _list_regions(self, req: dp.ListLocationsRequest) -> list[str]:
+        """List the region UUIDs matching the request, via the regions cache."""
+        energy_source = req.energy_source_filter
+        # Hold a per-source lock across the lookup, so concurrent cache misses make one call
+        async with self._regions_locks[energy_source]:
+            regions = self._regions_cache.get(energy_source)
+            if regions is None:
+                resp = await self.dp_client.list_locations(req)
+                regions = [loc.location_uuid for loc in resp.locations]
+                self._regions_cache[energy_source] = regions
+        return list(regions)
+
     async def _check_user_access(
         self,
         location_uuid: UUID,
@@ -1,3 +1,4 @@
+import asyncio
 import dataclasses
 import datetime as dt
 import unittest
@@ -127,6 +128,27 @@ class TestDataPlatformClient(unittest.IsolatedAsyncioTestCase):
             with self.subTest(tc.name):
                 resp = await client.get_sites(authdata=tc.authdata)
                 self.assertEqual(len(resp), tc.expected_num_sites)
+                for site in resp:
+                    self.assertEqual(site.orientation, 180.0)
+                    self.assertEqual(site.tilt, 30.0)
+
+    @patch("dp_sdk.ocf.dp.DataPlatformDataServiceStub")
+    async def test_get_regions_cached(self, client_mock: dp.DataPlatformDataServiceStub) -> None:
+        client_mock.list_locations = AsyncMock(
+            return_value=dp.ListLocationsResponse(
+                locations=[
+                    dp.ListLocationsResponseLocationSummary(location_uuid="region_uuid"),
+                ],
+            ),
+        )
+
+        client = Client.from_dp(client_mock)
+        for _ in range(3):
+            self.assertListEqual(await client.get_wind_regions(), ["region_uuid"])
+            self.assertListEqual(await client.get_solar_regions(), ["region_uuid"])
+
+        # One call per energy source, the rest are served from the cache
+        self.assertEqual(client_mock.list_locations.await_count, 2)
 
     @patch("dp_sdk.ocf.dp.DataPlatformDataServiceStub")
     async def test_get_site_forecast(self, client_mock: dp.DataPlatformDataServiceStub) -> None:
@@ -172,6 +194,44 @@ class TestDataPlatformClient(unittest.IsolatedAsyncioTestCase):
                     )
                     self.assertEqual(len(resp), 5)
 
+    @patch("dp_sdk.ocf.dp.DataPlatformDataServiceStub")
+    async def test_get_site_forecast_checks_access_first(
+        self,
+        client_mock: dp.DataPlatformDataServiceStub,
+    ) -> None:
+        async def slow_list_locations(req: dp.ListLocationsRequest) -> dp.ListLocationsResponse:
+            await asyncio.sleep(0.01)
+            return mock_list_locations(req)
+
+        async def failing_get_latest_forecasts(
+            _: dp.GetLatestForecastsRequest,
+        ) -> dp.GetLatestForecastsResponse:
+            raise RuntimeError("forecasts lookup failed")
+
+        async def hanging_get_latest_forecasts(
+            _: dp.GetLatestForecastsRequest,
+        ) -> dp.GetLatestForecastsResponse:
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        client = Client.from_dp(client_mock)
+        client_mock.list_locations = AsyncMock(side_effect=slow_list_locations)
+        for name, get_latest_forecasts in [
+            ("Should report no access over a failed lookup", failing_get_latest_forecasts),
+            ("Should cancel the lookup when access is denied", hanging_get_latest_forecasts),
+        ]:
+            client_mock.get_latest_forecasts = AsyncMock(side_effect=get_latest_forecasts)
+
+            with self.subTest(name), self.assertRaises(HTTPException) as e:
+                await asyncio.wait_for(
+                    client.get_site_forecast(
+                        site_uuid=uuid.uuid4(),
+                        authdata={"sub": "no_access_user"},
+                    ),
+                    timeout=1,
+                )
+            self.assertEqual(e.exception.status_code, 404)
+
     @patch("dp_sdk.ocf.dp.DataPlatformDataServiceStub")
     async def test_get_site_generation(
         self,
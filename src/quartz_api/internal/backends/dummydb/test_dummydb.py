@@ -35,6 +35,10 @@ class TestDummyDatabase(unittest.IsolatedAsyncioTestCase):
         out = await client.get_solar_regions()
         self.assertIsNotNone(out)
 
+    async def test_get_all_regions(self) -> None:
+        out = await client.get_all_regions()
+        self.assertEqual(set(out.keys()), {"wind", "solar"})
+
     async def test_get_sites(self) -> None:
         out = await client.get_sites(authdata={EMAIL_KEY: "test-test@test.com"})
         self.assertIsNotNone(out)
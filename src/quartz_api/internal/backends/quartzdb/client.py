@@ -5,7 +5,6 @@ import logging
 import os
 from uuid import UUID
 
-import pandas as pd
 import sentry_sdk
 from fastapi import HTTPException
 from pvsite_datamodel import DatabaseConnection
@@ -15,13 +14,21 @@ from pvsite_datamodel.read import (
     get_pv_generation_by_sites,
     get_site_by_uuid,
     get_sites_by_country,
-    get_sites_from_user,
     get_user_by_email,
 )
-from pvsite_datamodel.sqlmodels import ForecastValueSQL, LocationAssetType
+from pvsite_datamodel.sqlmodels import (
+    ForecastValueSQL,
+    GenerationSQL,
+    LocationAssetType,
+    LocationGroupLocationSQL,
+    LocationSQL,
+    MLModelSQL,
+    UserSQL,
+)
 from pvsite_datamodel.write.database import save_api_call_to_db
-from pvsite_datamodel.write.generation import insert_generation_values
 from pvsite_datamodel.write.user_and_site import edit_site
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 from typing_extensions import override
 
@@ -115,12 +122,12 @@ class Client(models.DatabaseInterface):
             )
             forecast_values: list[ForecastValueSQL] = values[site.location_uuid]
 
-        # convert ForecastValueSQL to PredictedPower
+        # convert ForecastValueSQL to PredictedPower, the values are trusted so skip validation
         out = [
-            models.PredictedPower(
-                PowerKW=int(value.forecast_power_kw)
+            models.PredictedPower.model_construct(
+                PowerKW=float(int(value.forecast_power_kw))
                 if value.forecast_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                else 0.0,  # Set negative values of PowerKW up to 0
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
                 CreatedTime=value.created_utc.replace(tzinfo=dt.UTC),
             )
@@ -158,12 +165,12 @@ class Client(models.DatabaseInterface):
                 end_utc=end,
             )
 
-        # convert from GenerationSQL to ActualPower
+        # convert from GenerationSQL to ActualPower, the values are trusted so skip validation
         out = [
-            models.ActualPower(
-                PowerKW=int(value.generation_power_kw)
+            models.ActualPower.model_construct(
+                PowerKW=float(int(value.generation_power_kw))
                 if value.generation_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                else 0.0,  # Set negative values of PowerKW up to 0
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
             )
             for value in values
@@ -241,7 +248,15 @@ class Client(models.DatabaseInterface):
         # get sites uuids from user
         with self._get_session() as session:
             user = get_user_by_email(session, authdata[EMAIL_KEY])
-            sites_sql = get_sites_from_user(session, user=user)
+            sites_sql = session.scalars(
+                select(LocationSQL)
+                .join(
+                    LocationGroupLocationSQL,
+                    LocationGroupLocationSQL.location_uuid == LocationSQL.location_uuid,
+                )
+                .where(LocationGroupLocationSQL.location_group_uuid == user.location_group_uuid)
+                .order_by(LocationGroupLocationSQL.created_utc),
+            )
 
             sites = []
             for site_sql in sites_sql:
@@ -305,10 +320,14 @@ class Client(models.DatabaseInterface):
                 site_uuid=site_uuid,
             )
 
-            # get site and the get the ml model name
-            site = get_site_by_uuid(session=session, site_uuid=str(site_uuid))
-            if site.ml_model is not None:
-                ml_model_name = site.ml_model.name
+            # get the site's ml model name, without loading the site and model separately
+            site_ml_model_name = session.scalar(
+                select(MLModelSQL.name)
+                .join(LocationSQL, LocationSQL.ml_model_uuid == MLModelSQL.model_uuid)
+                .where(LocationSQL.location_uuid == site_uuid),
+            )
+            if site_ml_model_name is not None:
+                ml_model_name = site_ml_model_name
             log.info(f"Using ml model {ml_model_name}")
 
             values = get_latest_forecast_values_by_site(
@@ -319,12 +338,12 @@ class Client(models.DatabaseInterface):
             )
             forecast_values: list[ForecastValueSQL] = values[site_uuid]
 
-            # convert ForecastValueSQL to PredictedPower
+        # convert ForecastValueSQL to PredictedPower, the values are trusted so skip validation
         out = [
-            models.PredictedPower(
-                PowerKW=int(value.forecast_power_kw)
+            models.PredictedPower.model_construct(
+                PowerKW=float(int(value.forecast_power_kw))
                 if value.forecast_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                else 0.0,  # Set negative values of PowerKW up to 0
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
                 CreatedTime=value.created_utc.replace(tzinfo=dt.UTC),
             )
@@ -359,12 +378,12 @@ class Client(models.DatabaseInterface):
                 end_utc=end,
             )
 
-        # convert from GenerationSQL to PredictedPower
+        # convert from GenerationSQL to ActualPower, the values are trusted so skip validation
         out = [
-            models.ActualPower(
-                PowerKW=int(value.generation_power_kw)
+            models.ActualPower.model_construct(
+                PowerKW=float(int(value.generation_power_kw))
                 if value.generation_power_kw >= 0
-                else 0,  # Set negative values of PowerKW up to 0
+                else 0.0,  # Set negative values of PowerKW up to 0
                 Time=value.start_utc.replace(tzinfo=dt.UTC),
             )
             for value in values
@@ -386,24 +405,13 @@ class Client(models.DatabaseInterface):
                 site_uuid=site_uuid,
             )
 
-            generations = []
-            for pv_actual_value in generation:
-                generations.append(
-                    {
-                        "start_utc": pv_actual_value.Time,
-                        "power_kw": pv_actual_value.PowerKW,
-                        "site_uuid": site_uuid,
-                    },
-                )
-
-            generation_values_df = pd.DataFrame(generations)
             capacity_factor = float(os.getenv("ERROR_GENERATION_CAPACITY_FACTOR", 1.1))
             site = get_site_by_uuid(session=session, site_uuid=str(site_uuid))
             site_capacity_kw = site.capacity_kw
-            exceeded_capacity = generation_values_df[
-                generation_values_df["power_kw"] > site_capacity_kw * capacity_factor
-            ]
-            if len(exceeded_capacity) > 0:
+            exceeded_capacity = any(
+                value.PowerKW > site_capacity_kw * capacity_factor for value in generation
+            )
+            if exceeded_capacity:
                 # alert Sentry and return 422 validation error
                 sentry_sdk.capture_message(
                     f"Error processing generation values. "
@@ -423,7 +431,23 @@ class Client(models.DatabaseInterface):
                     ),
                 )
 
-            insert_generation_values(session, generation_values_df)
+            if len({value.Time for value in generation}) < len(generation):
+                log.warning(f'duplicate target datetimes for site "{site_uuid}"')
+
+            # insert all the values in one batched statement
+            rows = [
+                {
+                    "location_uuid": site_uuid,
+                    "generation_power_kw": value.PowerKW,
+                    "start_utc": value.Time,
+                    # Generation values are treated as 5 minute periods, as in pvsite_datamodel
+                    "end_utc": value.Time + dt.timedelta(minutes=5),
+                }
+                for value in generation
+            ]
+            if len(rows) > 0:
+                stmt = postgresql.insert(GenerationSQL.__table__).on_conflict_do_nothing()
+                session.execute(stmt, rows)
             session.commit()
 
     @override
@@ -455,8 +479,16 @@ def check_user_has_access_to_site(
     site_uuid: UUID,
 ) -> None:
     """Checks if a user has access to a site."""
-    user = get_user_by_email(session=session, email=email)
-    site_uuids = [str(site.location_uuid) for site in user.location_group.locations]
+    user: UserSQL = get_user_by_email(session=session, email=email)
+    # only the uuids are needed, so avoid loading the location group and its locations
+    site_uuids = [
+        str(location_uuid)
+        for location_uuid in session.scalars(
+            select(LocationGroupLocationSQL.location_uuid).where(
+                LocationGroupLocationSQL.location_group_uuid == user.location_group_uuid,
+            ),
+        )
+    ]
 
     if str(site_uuid) not in site_uuids:
         raise HTTPException(
@@ -2,6 +2,7 @@
 
 import datetime as dt
 import logging
+import os
 from collections.abc import Generator
 
 import pytest
@@ -14,16 +15,31 @@ from pvsite_datamodel.sqlmodels import (
     GenerationSQL,
     LocationSQL,
 )
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
+from .client import Client
+
 log = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session")
 def engine() -> Generator[Engine]:
-    """Database engine fixture."""
+    """Database engine fixture.
+
+    Set QUARTZ_TEST_DB to the URL of an existing Postgres database to run against it instead
+    of starting a container. The pvsite tables are created there if missing and are not
+    dropped afterwards. The queries under test are Postgres-specific, so the database can't be
+    swapped for SQLite.
+    """
+    url = os.getenv("QUARTZ_TEST_DB")
+    if url:
+        engine = create_engine(url)
+        yield engine
+        engine.dispose()
+        return
+
     with PostgresContainer("postgres:14.5") as postgres:
         url = postgres.get_connection_url()
         engine = create_engine(url)
@@ -33,10 +49,15 @@ def engine() -> Generator[Engine]:
 
 @pytest.fixture(scope="session")
 def tables(engine: Engine) -> Generator[None]:
-    """Create tables fixture."""
+    """Create tables fixture.
+
+    Tables are only dropped afterwards in the throwaway container database, never in a
+    database given via QUARTZ_TEST_DB.
+    """
     Base.metadata.create_all(engine)
     yield
-    Base.metadata.drop_all(engine)
+    if not os.getenv("QUARTZ_TEST_DB"):
+        Base.metadata.drop_all(engine)
 
 
 @pytest.fixture()
@@ -60,6 +81,35 @@ def db_session(
     connection.close()
 
 
+@pytest.fixture()
+def query_counter(engine: Engine) -> Generator[list[str]]:
+    """Record the SQL statements executed against the engine during a test."""
+    statements: list[str] = []
+
+    def _record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="session")
+def shared_client(engine: Engine) -> Client:
+    """Create a single Client for the session, so its connection pool is built once."""
+    return Client(database_url=str(engine.url))
+
+
+@pytest.fixture()
+def client(shared_client: Client, db_session: Session) -> Generator[Client]:
+    """Hooks the shared Client into pytest db_session fixture."""
+    shared_client.session = db_session
+
+    yield shared_client
+
+    shared_client.session = None
+
+
 @pytest.fixture()
 def sites(db_session: Session) -> list[LocationSQL]:
     """Seed some initial data into DB."""
@@ -2,8 +2,6 @@ import logging
 
 import pandas as pd
 import pytest
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session
 
 from quartz_api.internal.models import PredictedPower
 from quartz_api.internal.service.regions._csv import format_csv_and_created_time
@@ -13,14 +11,6 @@ from .client import Client
 
 log = logging.getLogger(__name__)
 
-@pytest.fixture()
-def client(engine: Engine, db_session: Session) -> Client:
-    """Hooks Client into pytest db_session fixture"""
-    client = Client(database_url=str(engine.url))
-    client.session = db_session
-
-    return client
-
 # Skip for now
 @pytest.mark.skip(reason="Not finished yet")
 class TestCsvExport:
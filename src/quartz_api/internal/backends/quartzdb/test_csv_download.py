@@ -3,49 +3,46 @@
 import datetime as dt
 import io
 import pathlib
+from collections.abc import Generator
 
 import pandas as pd
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from pvsite_datamodel.read.model import get_or_create_model
 from pvsite_datamodel.sqlmodels import ForecastSQL, ForecastValueSQL, LocationSQL
-from pyhocon import ConfigFactory
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session
+from pyhocon import ConfigFactory, ConfigTree
 
-from quartz_api.cmd.main import _create_server
+from quartz_api.cmd.main import _create_server, _load_conf
 from quartz_api.internal import models
 
 from .client import Client
 
 
-@pytest.fixture()
-def client(engine: Engine, db_session: Session) -> Client:
-    """Hooks Client into pytest db_session fixture."""
-    client = Client(database_url=str(engine.url))
-    client.session = db_session
-
-    return client
-
-
-@pytest.fixture()
-def test_client(client: Client) -> TestClient:
-    """Create a FastAPI test client."""
-    # Load config and override routers to include 'regions'
+@pytest.fixture(scope="session")
+def conf() -> ConfigTree:
+    """Load the server config, overriding the routers to include 'regions'."""
     conf_path = pathlib.Path(__file__).parent.parent.parent.parent / "cmd" / "server.conf"
-    conf = ConfigFactory.parse_file(conf_path.as_posix())
-
-    # Override config to include regions router
     override_conf = ConfigFactory.from_dict({"api": {"routers": "regions"}})
-    conf = override_conf.with_fallback(conf)
+    return override_conf.with_fallback(_load_conf(conf_path.as_posix()))
+
+
+@pytest.fixture(scope="session")
+def app(conf: ConfigTree) -> FastAPI:
+    """Create the FastAPI app once, as route registration is costly."""
+    return _create_server(conf=conf)
 
-    # Create the FastAPI app
-    app = _create_server(conf=conf)
 
+@pytest.fixture()
+def test_client(client: Client, app: FastAPI) -> Generator[TestClient]:
+    """Create a FastAPI test client against the shared app."""
     # Override the database dependency with our test client
     app.dependency_overrides[models.get_db_client] = lambda: client
 
-    return TestClient(app)
+    yield TestClient(app)
+
+    # Don't leak this test's database session into the next test
+    app.dependency_overrides.pop(models.get_db_client, None)
 
 
 class TestCsvDownload:
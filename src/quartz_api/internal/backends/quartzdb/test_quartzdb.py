@@ -7,8 +7,6 @@ import logging
 import pytest
 from fastapi import HTTPException
 from pvsite_datamodel.sqlmodels import GenerationSQL, LocationSQL
-from sqlalchemy import Engine
-from sqlalchemy.orm import Session
 
 from quartz_api.internal.middleware.auth import EMAIL_KEY
 from quartz_api.internal.models import ActualPower, PredictedPower, SiteProperties
@@ -20,15 +18,6 @@ log = logging.getLogger(__name__)
 # TODO add list of test that are here
 
 
-@pytest.fixture()
-def client(engine: Engine, db_session: Session) -> Client:
-    """Hooks Client into pytest db_session fixture"""
-    client = Client(database_url=str(engine.url))
-    client.session = db_session
-
-    return client
-
-
 class TestQuartzDBClient:
     @pytest.mark.asyncio
     async def test_get_predicted_wind_power_production_for_location(
@@ -102,9 +91,16 @@ class TestQuartzDBClient:
         assert result[0] == "ruvnl"
 
     @pytest.mark.asyncio
-    async def test_get_sites(self, client: Client, sites: list[LocationSQL]) -> None:
+    async def test_get_sites(
+        self,
+        client: Client,
+        sites: list[LocationSQL],
+        query_counter: list[str],
+    ) -> None:
         sites_from_api = await client.get_sites(authdata={EMAIL_KEY: "test@test.com"})
         assert len(sites_from_api) == 2
+        # one query for the user and one for their sites, regardless of the number of sites
+        assert len(query_counter) <= 2
 
     @pytest.mark.asyncio
     async def test_get_sites_no_sites(self, client: Client, sites: list[LocationSQL]) -> None:
@@ -136,12 +132,15 @@ class TestQuartzDBClient:
         client: Client,
         sites: list[LocationSQL],
         forecast_values_site: None,
+        query_counter: list[str],
     ) -> None:
         out = await client.get_site_forecast(
             site_uuid=sites[0].location_uuid,
             authdata={EMAIL_KEY: "test@test.com"},
         )
         assert len(out) > 0
+        # user, site access, model name and forecast values, without lazy-loading the site
+        assert len(query_counter) <= 4
 
     @pytest.mark.asyncio
     async def test_get_site_forecast_no_forecast_values(
@@ -181,6 +180,27 @@ class TestQuartzDBClient:
             authdata={EMAIL_KEY: "test@test.com"},
         )
 
+    @pytest.mark.asyncio
+    async def test_post_site_generation_many_values(
+        self, client: Client, sites: list[LocationSQL],
+    ) -> None:
+        start = dt.datetime(2021, 1, 1, tzinfo=dt.UTC)
+        await client.post_site_generation(
+            site_uuid=sites[0].location_uuid,
+            generation=[
+                ActualPower(Time=start + dt.timedelta(minutes=5 * i), PowerKW=i % 4)
+                for i in range(100)
+            ],
+            authdata={EMAIL_KEY: "test@test.com"},
+        )
+        rows = client.session.query(GenerationSQL).order_by(GenerationSQL.start_utc).all()
+        assert len(rows) == 100
+        for i, row in enumerate(rows):
+            assert row.location_uuid == sites[0].location_uuid
+            assert row.generation_power_kw == i % 4
+            assert row.start_utc == (start + dt.timedelta(minutes=5 * i)).replace(tzinfo=None)
+            assert row.end_utc - row.start_utc == dt.timedelta(minutes=5)
+
     @pytest.mark.asyncio
     async def test_post_site_generation_exceding_max_capacity(
         self, client: Client, sites: list[LocationSQL],
@@ -10,6 +10,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 if TYPE_CHECKING:
     from quartz_api.internal import models
 
+# Paths hit by health probes and browsers loading the docs, which would otherwise each cost
+# a database write
+_UNAUDITED_PATHS = frozenset({"/health", "/favicon.ico", "/docs", "/swagger", "/openapi.json"})
+
 
 class RequestLoggerMiddleware(BaseHTTPMiddleware):
     """Middleware to log API requests to the database."""
@@ -24,6 +28,11 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
         """Log the API request to the database and proceed with the request."""
+        # Skip unaudited routes before doing any logging work
+        path: str = request.scope["path"]
+        if path in _UNAUDITED_PATHS or path.startswith("/static/"):
+            return await call_next(request)
+
         response = await call_next(request)
 
         # Skip OPTIONS requests
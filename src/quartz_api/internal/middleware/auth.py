@@ -1,17 +1,37 @@
 """Authentication dependency for FastAPI using Auth0 JWT tokens."""
 
 # ruff: noqa: B008
-from typing import Annotated
-
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Annotated, Any
+
+import cachetools
 import jwt
+import sentry_sdk
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+log = logging.getLogger(__name__)
+
 token_auth_scheme = HTTPBearer()
 
 EMAIL_KEY = "https://openclimatefix.org/email"
 
 
+def _set_request_auth(request: Request, payload: dict[str, str]) -> None:
+    """Store the validated payload on the request, and tag the Sentry user with it.
+
+    The user is set before the route runs, so it is attached to any event Sentry captures
+    while handling the request.
+    """
+    request.state.auth = payload
+    if sentry_sdk.is_initialized():
+        sentry_sdk.set_user({"id": payload.get("sub"), "email": payload.get(EMAIL_KEY)})
+
+
 class Auth0:
     """Fast api dependency that validates an JWT token."""
 
@@ -22,6 +42,22 @@ class Auth0:
         self._algorithm = algorithm
 
         self._jwks_client = jwt.PyJWKClient(f"https://{domain}/.well-known/jwks.json")
+        self._keys: dict[str | None, Any] = {}
+
+    def refresh_keys(self) -> None:
+        """Fetch the JWKS and replace the signing keys held in memory."""
+        jwk_set = self._jwks_client.get_jwk_set(refresh=True)
+        self._keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys}
+
+    async def refresh_keys_periodically(self, interval: float = 600) -> None:
+        """Keep the signing keys up to date, so requests don't have to fetch them."""
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh_keys)
+            except Exception:
+                # Keep refreshing, e.g. past a proxy error page served in place of the JWKS
+                log.exception("Failed to refresh JWKS")
+            await asyncio.sleep(interval)
 
     def __call__(
         self,
@@ -32,7 +68,13 @@ class Auth0:
         token = auth_credentials.credentials
 
         try:
-            signing_key = self._jwks_client.get_signing_key_from_jwt(token).key
+            kid = jwt.get_unverified_header(token).get("kid")
+            signing_key = self._keys.get(kid)
+            if signing_key is None:
+                # The refreshed keys are authoritative, so a key missing from them is only
+                # accepted if the JWKS client finds it, refetching the key set on a miss. This
+                # picks up newly rotated keys, while keys pulled from the JWKS are rejected.
+                signing_key = self._jwks_client.get_signing_key(kid).key
         except (jwt.exceptions.PyJWKClientError, jwt.exceptions.DecodeError) as e:
             raise HTTPException(status_code=401, detail=str(e)) from e
 
@@ -47,7 +89,62 @@ class Auth0:
         except Exception as e:
             raise HTTPException(status_code=401, detail=str(e)) from e
 
-        request.state.auth = payload
+        _set_request_auth(request, payload)
+
+        return payload
+
+
+class CachedAuth0(Auth0):
+    """Auth0 dependency that caches validated JWT payloads.
+
+    Tokens are reused across many requests within their lifetime, so successful validations
+    are cached by a 128-bit BLAKE2b hash of the token for up to five minutes. Cache hits skip
+    the JWKS lookup and the RS256 signature verification entirely. Entries never outlive the
+    token's own expiry, and failed validations are never cached.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        api_audience: str,
+        algorithm: str,
+        ttl: float = 300,
+        maxsize: int = 4096,
+    ) -> None:
+        """Initialize the cached Auth dependency."""
+        super().__init__(domain=domain, api_audience=api_audience, algorithm=algorithm)
+        self._ttl = ttl
+        self._cache: cachetools.TLRUCache[bytes, dict[str, str]] = cachetools.TLRUCache(
+            maxsize=maxsize,
+            ttu=self._time_to_use,
+        )
+        # Sync dependencies are run in a threadpool, so guard the cache with a thread lock
+        self._lock = threading.Lock()
+
+    def _time_to_use(self, _: bytes, payload: dict[str, str], now: float) -> float:
+        """Expire a cached payload after the TTL, or when its token expires if sooner."""
+        ttl = self._ttl
+        if "exp" in payload:
+            ttl = min(ttl, float(payload["exp"]) - time.time())
+        return now + ttl
+
+    def __call__(
+        self,
+        request: Request,
+        auth_credentials: HTTPAuthorizationCredentials = Depends(token_auth_scheme),
+    ) -> dict[str, str]:
+        """Return the cached payload for the token, validating it on a cache miss."""
+        key = hashlib.blake2b(auth_credentials.credentials.encode(), digest_size=16).digest()
+        with self._lock:
+            payload = self._cache.get(key)
+
+        if payload is None:
+            # Validation also stores the payload on the request
+            payload = super().__call__(request, auth_credentials)
+            with self._lock:
+                self._cache[key] = payload
+        else:
+            _set_request_auth(request, payload)
 
         return payload
 
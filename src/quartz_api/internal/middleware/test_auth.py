@@ -0,0 +1,196 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials
+
+from quartz_api.internal.middleware.auth import EMAIL_KEY, Auth0, CachedAuth0
+
+DOMAIN = "test.example.com"
+AUDIENCE = "https://test-audience/"
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def make_jwks(*kids: str) -> dict[str, list[dict[str, str]]]:
+    keys = []
+    for kid in kids:
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+        keys.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+    return {"keys": keys}
+
+
+def make_credentials(kid: str = "key1", expires_in: float = 60) -> HTTPAuthorizationCredentials:
+    token = jwt.encode(
+        {
+            "sub": "auth0|user",
+            EMAIL_KEY: "test@test.com",
+            "aud": AUDIENCE,
+            "iss": f"https://{DOMAIN}/",
+            "exp": time.time() + expires_in,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def make_request() -> Request:
+    return Request(scope={"type": "http"})
+
+
+class TestAuth0(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.auth = Auth0(domain=DOMAIN, api_audience=AUDIENCE, algorithm="RS256")
+
+    def test_refresh_keys(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+        self.assertEqual(list(self.auth._keys), ["key1"])
+
+    def test_call_uses_refreshed_keys(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+        request = make_request()
+        with patch.object(self.auth._jwks_client, "fetch_data") as fetch_data:
+            payload = self.auth(request, make_credentials())
+            fetch_data.assert_not_called()
+
+        self.assertEqual(payload["sub"], "auth0|user")
+        self.assertEqual(request.state.auth, payload)
+
+    def test_call_rejects_key_removed_from_jwks(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+            self.auth(make_request(), make_credentials())
+
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key2")):
+            self.auth.refresh_keys()
+            with self.assertRaises(HTTPException) as e:
+                self.auth(make_request(), make_credentials(kid="key1"))
+
+        self.assertEqual(e.exception.status_code, 401)
+
+    def test_call_accepts_key_added_since_refresh(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+        jwks = make_jwks("key1", "key2")
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=jwks):
+            payload = self.auth(make_request(), make_credentials(kid="key2"))
+
+        self.assertEqual(payload["sub"], "auth0|user")
+
+    def test_call_sets_sentry_user(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+        with (
+            patch("sentry_sdk.is_initialized", return_value=True),
+            patch("sentry_sdk.set_user") as set_user,
+        ):
+            self.auth(make_request(), make_credentials())
+
+        set_user.assert_called_once_with({"id": "auth0|user", "email": "test@test.com"})
+
+    def test_call_skips_sentry_user_when_disabled(self) -> None:
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+        with (
+            patch("sentry_sdk.is_initialized", return_value=False),
+            patch("sentry_sdk.set_user") as set_user,
+        ):
+            self.auth(make_request(), make_credentials())
+
+        set_user.assert_not_called()
+
+    async def test_refresh_keys_periodically_survives_errors(self) -> None:
+        loop = asyncio.get_running_loop()
+        refreshed = asyncio.Event()
+        calls = 0
+
+        def fetch_data() -> dict[str, list[dict[str, str]]]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise json.JSONDecodeError("Expecting value", "<html>", 0)
+            loop.call_soon_threadsafe(refreshed.set)
+            return make_jwks("key1")
+
+        with patch.object(self.auth._jwks_client, "fetch_data", side_effect=fetch_data):
+            task = asyncio.create_task(self.auth.refresh_keys_periodically(interval=0.01))
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+            self.assertFalse(task.done())
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        self.assertTrue(task.cancelled())
+        self.assertEqual(list(self.auth._keys), ["key1"])
+
+
+class TestCachedAuth0(unittest.TestCase):
+    def setUp(self) -> None:
+        self.auth = CachedAuth0(domain=DOMAIN, api_audience=AUDIENCE, algorithm="RS256")
+        with patch.object(self.auth._jwks_client, "fetch_data", return_value=make_jwks("key1")):
+            self.auth.refresh_keys()
+
+    def test_cache_hit_skips_verification(self) -> None:
+        credentials = make_credentials()
+        with patch("jwt.decode", wraps=jwt.decode) as decode:
+            first = self.auth(make_request(), credentials)
+            second = self.auth(make_request(), credentials)
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_cache_hit_sets_request_state(self) -> None:
+        credentials = make_credentials()
+        payload = self.auth(make_request(), credentials)
+
+        request = make_request()
+        self.auth(request, credentials)
+
+        self.assertEqual(request.state.auth, payload)
+
+    def test_sentry_user_set_once_per_request(self) -> None:
+        credentials = make_credentials()
+        with (
+            patch("sentry_sdk.is_initialized", return_value=True),
+            patch("sentry_sdk.set_user") as set_user,
+        ):
+            self.auth(make_request(), credentials)
+            self.assertEqual(set_user.call_count, 1)
+            self.auth(make_request(), credentials)
+            self.assertEqual(set_user.call_count, 2)
+
+    def test_cache_entry_expires_with_token(self) -> None:
+        credentials = make_credentials(expires_in=1)
+        self.auth(make_request(), credentials)
+
+        time.sleep(1.1)
+        with self.assertRaises(HTTPException) as e:
+            self.auth(make_request(), credentials)
+
+        self.assertEqual(e.exception.status_code, 401)
+
+    def test_failed_validation_not_cached(self) -> None:
+        wrong_audience = CachedAuth0(domain=DOMAIN, api_audience="other", algorithm="RS256")
+        wrong_audience._keys = self.auth._keys
+        credentials = make_credentials()
+
+        with patch("jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(2):
+                with self.assertRaises(HTTPException):
+                    wrong_audience(make_request(), credentials)
+
+        self.assertEqual(decode.call_count, 2)
+        self.assertEqual(len(wrong_audience._cache), 0)
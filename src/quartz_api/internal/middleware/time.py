@@ -21,11 +21,11 @@ class TimerMiddleware(BaseHTTPMiddleware):
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
         """Log the time taken to process the request and proceed with the request."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         response = await call_next(request)
-        process_time = str(time.time() - start_time)
+        process_time = f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}"
 
-        logging.info(f"Process Time {process_time} {request.url}")
+        logging.info("Process Time %s %s", process_time, request.url)
         response.headers["X-Process-Time"] = process_time
 
         return response
@@ -1,6 +1,7 @@
 """Defines the domain interface for interacting with a backend."""
 
 import abc
+import asyncio
 from typing import Annotated
 from uuid import UUID
 
@@ -80,6 +81,14 @@ class DatabaseInterface(abc.ABC):
         """Returns a list of solar regions."""
         pass
 
+    async def get_all_regions(self) -> dict[str, list[str]]:
+        """Returns the wind and solar regions, keyed by source.
+
+        Both region lists are fetched concurrently.
+        """
+        wind, solar = await asyncio.gather(self.get_wind_regions(), self.get_solar_regions())
+        return {"wind": wind, "solar": solar}
+
     @abc.abstractmethod
     async def save_api_call_to_db(self, url: str, authdata: dict[str, str]) -> None:
         """Saves an API call to the database."""
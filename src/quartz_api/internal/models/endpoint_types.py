@@ -7,7 +7,7 @@ from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from fastapi import Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ForecastHorizon(str, Enum):
@@ -27,31 +27,35 @@ class ForecastHorizon(str, Enum):
 class PredictedPower(BaseModel):
     """Defines the data structure for a predicted power value returned by the API."""
 
+    model_config = ConfigDict(frozen=True)
+
     PowerKW: float
     Time: dt.datetime
     CreatedTime: dt.datetime = Field(exclude=True)
 
     def to_timezone(self, tz: str) -> "PredictedPower":
         """Converts the time of this predicted power value to the given timezone."""
-        return PredictedPower(
-            PowerKW=self.PowerKW,
-            Time=self.Time.astimezone(tz=ZoneInfo(key=tz)),
-            CreatedTime=self.CreatedTime.astimezone(tz=ZoneInfo(key=tz)),
+        # Only the times change, so copy without re-validating the unchanged fields
+        zone = ZoneInfo(key=tz)
+        return self.model_copy(
+            update={
+                "Time": self.Time.astimezone(tz=zone),
+                "CreatedTime": self.CreatedTime.astimezone(tz=zone),
+            },
         )
 
 
 class ActualPower(BaseModel):
     """Defines the data structure for an actual power value returned by the API."""
 
+    model_config = ConfigDict(frozen=True)
+
     PowerKW: float
     Time: dt.datetime
 
     def to_timezone(self, tz: str) -> "ActualPower":
         """Converts the time of this predicted power value to the given timezone."""
-        return ActualPower(
-            PowerKW=self.PowerKW,
-            Time=self.Time.astimezone(tz=ZoneInfo(key=tz)),
-        )
+        return self.model_copy(update={"Time": self.Time.astimezone(tz=ZoneInfo(key=tz))})
 
 class LocationPropertiesBase(BaseModel):
     """Properties common to all locations."""
@@ -77,6 +81,8 @@ class LocationPropertiesBase(BaseModel):
 class SiteProperties(LocationPropertiesBase):
     """Properties specific to a site."""
 
+    model_config = ConfigDict(frozen=True)
+
     client_site_name: str | None = Field(
         None,
         json_schema_extra={"description": "The name of the site as given by the providing user."},
@@ -64,6 +64,25 @@ async def get_regions_route(
     return GetRegionsResponse(regions=regions)
 
 
+class GetAllRegionsResponse(BaseModel):
+    """Model for the all-regions endpoint response."""
+
+    regions: dict[str, list[str]]
+
+
+@router.get(
+    "/regions",
+    status_code=status.HTTP_200_OK,
+)
+async def get_all_regions_route(
+    db: models.DBClientDependency,
+    auth: AuthDependency,
+) -> GetAllRegionsResponse:
+    """Get available regions for every source, keyed by source."""
+    regions = await db.get_all_regions()
+    return GetAllRegionsResponse(regions=regions)
+
+
 class GetHistoricGenerationResponse(BaseModel):
     """Model for the historic generation endpoint response."""
 
@@ -0,0 +1,33 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from quartz_api.internal import models
+from quartz_api.internal.backends.dummydb.client import Client
+from quartz_api.internal.middleware import auth
+
+from .router import router
+
+
+class TestGetAllRegionsRoute(unittest.TestCase):
+    def setUp(self) -> None:
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[models.get_db_client] = Client
+        app.dependency_overrides[auth.get_auth] = auth.DummyAuth()
+        self.client = TestClient(app)
+
+    def test_get_all_regions_keyed_by_source(self) -> None:
+        response = self.client.get("/regions")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "regions": {
+                    "wind": ["dummy_wind_region1", "dummy_wind_region2"],
+                    "solar": ["dummy_solar_region1", "dummy_solar_region2"],
+                },
+            },
+        )